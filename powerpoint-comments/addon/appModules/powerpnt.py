@@ -26,15 +26,204 @@ import comHelper  # NVDA's COM helper - handles UIAccess privilege issues
 import speech  # For canceling queued speech (v0.0.37)
 import ui
 import api
+import inspect
+import re
 import threading
+import time
+import weakref
+from functools import lru_cache
+from collections import deque
 import ctypes
+from ctypes import byref, POINTER
+from ctypes.wintypes import BOOL, DWORD, HANDLE, HWND, LPARAM, LPCWSTR, LPVOID, MSG, UINT
 import comtypes
 from comtypes import CoInitializeEx, CoUninitialize, COINIT_APARTMENTTHREADED, COMObject, GUID
-from comtypes.automation import IDispatch
+from comtypes import COMError
+from comtypes.automation import IDispatch, DISPATCH_PROPERTYGET
+from comtypes.hresult import DISP_E_MEMBERNOTFOUND
 from comtypes.client._events import _AdviseConnection
 from queueHandler import queueFunction, eventQueue
 from scriptHandler import script
-import inputCore
+
+# Patterns used on every comment focus and notes read - compiled once at import
+# Meeting notes live between **** markers (v0.0.53)
+_NOTES_MARKER_BLOCK_RE = re.compile(r'\*{4,}\s*(.*?)\s*\*{4,}', re.DOTALL)
+_NOTES_MARKER_RE = re.compile(r'\*{4,}\s*')
+_NOTES_TAG_RE = re.compile(r'</?(?:meeting|critical)\s*notes>', re.IGNORECASE)
+# PowerPoint uses non-breaking spaces (U+00A0) in names (v0.0.42)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# UIAutomationIds that place focus inside the Comments pane (v0.0.31)
+_COMMENTS_UIA_EXACT = frozenset(('NewCommentButton', 'CommentsList'))
+_COMMENTS_UIA_PREFIXES = ('cardRoot_', 'firstPaneElement')
+
+# Announcements from the worker ask NVDA to pump its queue right away instead
+# of on the next core tick; older NVDA versions have no _immediate parameter
+# and would pass it on to the queued function
+_QUEUE_IMMEDIATE = (
+    {"_immediate": True}
+    if "_immediate" in inspect.signature(queueFunction).parameters
+    else {}
+)
+
+# Win32 functions for the worker's message pump, bound once with explicit
+# prototypes. Private WinDLL instances so our argtypes don't change the
+# shared ctypes.windll functions other NVDA code uses.
+_user32 = ctypes.WinDLL("user32")
+_kernel32 = ctypes.WinDLL("kernel32")
+
+_MsgWaitForMultipleObjectsEx = _user32.MsgWaitForMultipleObjectsEx
+_MsgWaitForMultipleObjectsEx.argtypes = (DWORD, POINTER(HANDLE), DWORD, DWORD, DWORD)
+_MsgWaitForMultipleObjectsEx.restype = DWORD
+_PeekMessageW = _user32.PeekMessageW
+_PeekMessageW.argtypes = (POINTER(MSG), HWND, UINT, UINT, UINT)
+_PeekMessageW.restype = BOOL
+_TranslateMessage = _user32.TranslateMessage
+_TranslateMessage.argtypes = (POINTER(MSG),)
+_TranslateMessage.restype = BOOL
+_DispatchMessageW = _user32.DispatchMessageW
+_DispatchMessageW.argtypes = (POINTER(MSG),)
+_DispatchMessageW.restype = LPARAM
+_CreateEventW = _kernel32.CreateEventW
+_CreateEventW.argtypes = (LPVOID, BOOL, BOOL, LPCWSTR)
+_CreateEventW.restype = HANDLE
+_SetEvent = _kernel32.SetEvent
+_SetEvent.argtypes = (HANDLE,)
+_SetEvent.restype = BOOL
+_CloseHandle = _kernel32.CloseHandle
+_CloseHandle.argtypes = (HANDLE,)
+_CloseHandle.restype = BOOL
+
+# The worker owns no UI, so it only wakes for the posted and sent messages
+# COM uses to deliver calls and events - not for input, paint or timers
+QS_POSTMESSAGE = 0x0008
+QS_SENDMESSAGE = 0x0040
+QS_ALLPOSTMESSAGE = 0x0100
+QS_COM_MESSAGES = QS_POSTMESSAGE | QS_SENDMESSAGE | QS_ALLPOSTMESSAGE
+# Also return for messages already in the queue that a nested COM modal loop
+# has seen but not removed - plain MsgWaitForMultipleObjects would sleep on them
+MWMO_INPUTAVAILABLE = 0x0004
+WAIT_OBJECT_0 = 0x00000000
+PM_REMOVE = 0x0001
+
+# DISPIDs resolved by _get_com_path, keyed by (starting object type, names...).
+# comtypes only caches DISPIDs per wrapper, and every property read returns a
+# new wrapper - so each level of a chain otherwise costs a GetIDsOfNames round
+# trip to PowerPoint on top of the Invoke.
+_dispid_cache = {}
+
+
+def _get_com_path(obj, kind, *names):
+    """Read obj.names[0].names[1]... resolving each DISPID once per process.
+
+    Args:
+        obj: Starting COM object (dynamic dispatch wrapper or IDispatch pointer)
+        kind: Name of obj's COM type, e.g. "View" - DISPIDs are per type
+        names: Property names to read in turn
+
+    Returns:
+        The value of the last property in the chain
+    """
+    start = obj
+    try:
+        for depth, name in enumerate(names):
+            key = (kind,) + names[:depth + 1]
+            comobj = getattr(obj, "_comobj", obj)
+            dispid = _dispid_cache.get(key)
+            if dispid is None:
+                dispid = comobj.GetIDsOfNames(name)[0]
+                _dispid_cache[key] = dispid
+            obj = comobj.Invoke(dispid, _invkind=DISPATCH_PROPERTYGET)
+        return obj
+    except COMError as e:
+        if e.hresult != DISP_E_MEMBERNOTFOUND:
+            raise
+        # A cached DISPID doesn't fit this object - resolve by name instead
+        log.debug("_get_com_path: %s.%s not found by DISPID, using names", kind, ".".join(names))
+        _dispid_cache.clear()
+        obj = start
+        for name in names:
+            obj = getattr(obj, name)
+        return obj
+
+def _get_shape_text(shape):
+    """Return the stripped text of a Shape's text frame ("" if it has none).
+
+    Reads HasTextFrame, TextFrame, HasText and TextRange.Text through
+    _get_com_path, so the DISPIDs are looked up once rather than on every
+    wrapper along the way.
+    """
+    if not _get_com_path(shape, "Shape", "HasTextFrame"):
+        return ""
+    text_frame = _get_com_path(shape, "Shape", "TextFrame")
+    if not _get_com_path(text_frame, "TextFrame", "HasText"):
+        return ""
+    return _get_com_path(text_frame, "TextFrame", "TextRange", "Text").strip()
+
+# "Has N comments" prefixes for the counts most slides have, built once
+_COMMENT_COUNT_TEXTS = ("No comments", "Has 1 comment") + tuple(
+    f"Has {count} comments" for count in range(2, 21)
+)
+
+
+def _comment_count_text(count):
+    """Return the "Has N comment(s)" announcement prefix for count."""
+    if count < len(_COMMENT_COUNT_TEXTS):
+        return _COMMENT_COUNT_TEXTS[count]
+    return f"Has {count} comments"
+
+def _is_thread_card_name(name):
+    """Return True if name marks a comment thread card (v0.0.34 fallback
+    for cards that expose no UIAutomationId)."""
+    # Normalize whitespace - PowerPoint uses non-breaking spaces (U+00A0)
+    return 'Comment thread started by' in _WHITESPACE_RE.sub(' ', name)
+
+# Comment cards are focused again and again while the user moves through the
+# pane; their names only change when the thread does, so parse each once.
+# str.partition does each split in a single pass without building lists.
+@lru_cache(maxsize=256)
+def _parse_thread_name(name):
+    """Return (is_resolved, author) from a thread card's (cardRoot_) name.
+
+    Names look like "[Resolved ]Comment thread started by Author[, with N replies]".
+    """
+    # Normalize whitespace - PowerPoint uses non-breaking spaces (U+00A0)
+    name = _WHITESPACE_RE.sub(' ', name)
+    _, found, rest = name.partition(" started by ")
+    author = rest.partition(", with ")[0] if found else ""
+    return name.startswith("Resolved "), author
+
+@lru_cache(maxsize=256)
+def _parse_reply_name(name):
+    """Return (is_task_status, author) from a reply's (postRoot_) name.
+
+    Names look like "Comment by Author on ..." or "Task updated by Author on ..."
+    (v0.0.56).
+    """
+    name = _WHITESPACE_RE.sub(' ', name)
+    is_task_status = name.startswith("Task updated by ")
+    if not (is_task_status or name.startswith("Comment by ")):
+        return False, ""
+    author, found, _ = name.partition(" by ")[2].partition(" on ")
+    return is_task_status, author if found else ""
+
+# View type constants
+PP_VIEW_NORMAL = 9
+PP_VIEW_SLIDE_SORTER = 5
+PP_VIEW_NOTES = 10
+PP_VIEW_OUTLINE = 6
+PP_VIEW_SLIDE_MASTER = 3
+PP_VIEW_READING = 50
+
+# Readable names for the view types above, used only in log messages
+_VIEW_NAMES = {
+    PP_VIEW_NORMAL: "Normal",
+    PP_VIEW_SLIDE_SORTER: "SlideSorter",
+    PP_VIEW_NOTES: "Notes",
+    PP_VIEW_OUTLINE: "Outline",
+    PP_VIEW_SLIDE_MASTER: "SlideMaster",
+    PP_VIEW_READING: "Reading",
+}
 
 # ============================================================================
 # COM Event Interface - Defined Locally (v0.0.21)
@@ -69,6 +258,35 @@ class EApplication(IDispatch):
             "WindowSelectionChange",
             (["in"], ctypes.POINTER(IDispatch), "sel"),
         ),
+        # PresentationClose (DISPID 2004) - fires before a presentation closes
+        comtypes.DISPMETHOD(
+            [comtypes.dispid(2004)],
+            None,
+            "PresentationClose",
+            (["in"], ctypes.POINTER(IDispatch), "pres"),
+        ),
+        # PresentationOpen (DISPID 2006) - fires after a presentation is opened
+        comtypes.DISPMETHOD(
+            [comtypes.dispid(2006)],
+            None,
+            "PresentationOpen",
+            (["in"], ctypes.POINTER(IDispatch), "pres"),
+        ),
+        # NewPresentation (DISPID 2007) - fires after a presentation is created
+        comtypes.DISPMETHOD(
+            [comtypes.dispid(2007)],
+            None,
+            "NewPresentation",
+            (["in"], ctypes.POINTER(IDispatch), "pres"),
+        ),
+        # WindowActivate (DISPID 2009) - fires when a document window is activated
+        comtypes.DISPMETHOD(
+            [comtypes.dispid(2009)],
+            None,
+            "WindowActivate",
+            (["in"], ctypes.POINTER(IDispatch), "pres"),
+            (["in"], ctypes.POINTER(IDispatch), "wn"),
+        ),
         # SlideShowBegin (DISPID 2010) - fires when slideshow starts
         comtypes.DISPMETHOD(
             [comtypes.dispid(2010)],
@@ -112,46 +330,168 @@ class PowerPointEventSink(COMObject):
         """
         super().__init__()
         self._worker = worker
-        self._last_slide_index = -1
         log.info("PowerPointEventSink: Initialized with local EApplication interface")
 
+    # PpSelectionType values where the selection lives inside a slide
+    # (ppSelectionShapes, ppSelectionText)
+    _IN_SLIDE_SELECTION_TYPES = frozenset((2, 3))
+
     def WindowSelectionChange(self, sel):
         """Called when selection changes in PowerPoint window.
 
-        This event fires for text, shape, and slide selections.
-        We check if the slide index has changed.
+        This event fires for text, shape, and slide selections - often
+        several times for one click. Only the selection is handed to the
+        worker here; process_selection() runs once the burst is over.
+
+        Args:
+            sel: Selection object (IDispatch) - sel.Parent returns the DocumentWindow
+        """
+        try:
+            if self._worker and self._worker._ppt_app:
+                self._worker.on_selection_changed(sel)
+        except Exception as e:
+            log.error("PowerPointEventSink: Error in WindowSelectionChange - %s", e)
 
+    def process_selection(self, sel):
+        """Check whether a selection is on a different slide and report it.
+
+        Called by the worker with the last selection of a burst.
         v0.0.22: Use sel.Parent to get the SPECIFIC window that triggered the event.
         This fixes wrong data when multiple presentations are open.
 
         Args:
             sel: Selection object (IDispatch) - sel.Parent returns the DocumentWindow
         """
+        worker = self._worker
+        if not (worker and worker._ppt_app):
+            return
         try:
-            log.debug("PowerPointEventSink: WindowSelectionChange event received")
-            if self._worker and self._worker._ppt_app:
+            # Still runs on most caret moves - only pay for debug logging when enabled
+            debug = log.isEnabledFor(logging.DEBUG)
+            if debug:
+                log.debug("PowerPointEventSink: Processing selection change")
+            # Caret moves and shape selection (the bulk of these events while
+            # editing) stay on the current slide - skip the window/slide
+            # lookups once the worker knows which slide that is. Known gap:
+            # Find jumping straight into text on another slide is picked up
+            # on the next slide or empty selection instead.
+            if worker._cached_slide_index is not None:
                 try:
-                    # v0.0.22: Get the SPECIFIC window from sel.Parent
-                    # This is the key fix for multiple presentations
-                    window = None
-                    try:
-                        window = sel.Parent
+                    if _get_com_path(sel, "Selection", "Type") in self._IN_SLIDE_SELECTION_TYPES:
+                        return
+                except Exception as e:
+                    log.debug("PowerPointEventSink: sel.Type failed (%s)", e)
+
+            # v0.0.22: Get the SPECIFIC window from sel.Parent
+            # This is the key fix for multiple presentations
+            window = None
+            if worker._presentation_count == 1:
+                # Only one presentation open: the window the last
+                # selection named is still current, since WindowActivate
+                # and PresentationClose clear it
+                window = worker._current_window
+            if window is None:
+                try:
+                    window = _get_com_path(sel, "Selection", "Parent")
+                    if debug:
                         log.debug("PowerPointEventSink: Got window from sel.Parent")
-                    except Exception as e:
-                        log.debug(f"PowerPointEventSink: sel.Parent failed ({e}), using ActiveWindow")
-                        window = self._worker._ppt_app.ActiveWindow
-
-                    if window:
-                        current_index = window.View.Slide.SlideIndex
-                        if current_index != self._last_slide_index:
-                            log.info(f"PowerPointEventSink: Slide changed to {current_index}")
-                            self._last_slide_index = current_index
-                            # Pass the specific window to the worker
-                            self._worker.on_slide_changed_event(current_index, window)
                 except Exception as e:
-                    log.debug(f"PowerPointEventSink: Could not get slide - {e}")
+                    log.debug("PowerPointEventSink: sel.Parent failed (%s), using ActiveWindow", e)
+                    try:
+                        window = worker._ppt_app.ActiveWindow
+                    except Exception as e:
+                        # E.g. the window closed while the event was pending
+                        log.debug("PowerPointEventSink: ActiveWindow failed (%s)", e)
+                        return
+            if not window:
+                return
+
+            # Reuse the worker's View when the selection is in its window,
+            # saving one cross-process call per selection change. The worker
+            # owns that cache and drops it whenever the window or view changes.
+            # Compare raw interface pointers: every property read returns a
+            # new dynamic wrapper, but while we hold a reference COM hands
+            # back the same proxy for the window.
+            view = None
+            current = worker._current_window
+            if (current is not None and
+                    getattr(current, "_comobj", current) == getattr(window, "_comobj", window)):
+                view = worker._current_view
+            try:
+                if view is None:
+                    view = _get_com_path(window, "DocumentWindow", "View")
+                slide = _get_com_path(view, "View", "Slide")
+                current_index = _get_com_path(slide, "Slide", "SlideIndex")
+            except Exception as e:
+                # Window closed or no single slide (e.g. Slide Sorter)
+                log.debug("PowerPointEventSink: Could not get slide - %s", e)
+                worker.on_view_unknown()
+                return
+            # Pass the specific window, and the View and Slide
+            # already read from it, to the worker - it decides
+            # whether this is a new slide
+            worker.on_slide_changed_event(current_index, window, view, slide)
         except Exception as e:
-            log.error(f"PowerPointEventSink: Error in WindowSelectionChange - {e}")
+            log.error("PowerPointEventSink: Error processing selection change - %s", e)
+
+    def PresentationClose(self, pres):
+        """Called before a presentation closes.
+
+        The worker drops its cached window/View proxies - they may belong
+        to the closing presentation.
+
+        Args:
+            pres: Presentation object (IDispatch)
+        """
+        try:
+            log.debug("PowerPointEventSink: PresentationClose event received")
+            if self._worker:
+                self._worker.on_presentation_count_changed(-1)
+                self._worker.on_window_changed()
+        except Exception as e:
+            log.error("PowerPointEventSink: Error in PresentationClose - %s", e)
+
+    def PresentationOpen(self, pres):
+        """Called after a presentation is opened.
+
+        Args:
+            pres: Presentation object (IDispatch)
+        """
+        try:
+            log.debug("PowerPointEventSink: PresentationOpen event received")
+            if self._worker:
+                self._worker.on_presentation_count_changed(1)
+        except Exception as e:
+            log.error("PowerPointEventSink: Error in PresentationOpen - %s", e)
+
+    def NewPresentation(self, pres):
+        """Called after a new presentation is created.
+
+        Args:
+            pres: Presentation object (IDispatch)
+        """
+        try:
+            log.debug("PowerPointEventSink: NewPresentation event received")
+            if self._worker:
+                self._worker.on_presentation_count_changed(1)
+        except Exception as e:
+            log.error("PowerPointEventSink: Error in NewPresentation - %s", e)
+
+    def WindowActivate(self, pres, wn):
+        """Called when a document window is activated.
+
+        The worker's cached window/View no longer refer to the active window.
+
+        Args:
+            pres: Presentation object (IDispatch)
+            wn: DocumentWindow object (IDispatch)
+        """
+        try:
+            log.debug("PowerPointEventSink: WindowActivate event received")
+            if self._worker:
+                self._worker.on_window_activated()
+        except Exception as e:
+            log.error("PowerPointEventSink: Error in WindowActivate - %s", e)
 
     def SlideShowBegin(self, wn):
         """Called when slideshow starts.
@@ -166,7 +506,7 @@ class PowerPointEventSink(COMObject):
             if self._worker:
                 self._worker.on_slideshow_begin(wn)
         except Exception as e:
-            log.error(f"PowerPointEventSink: Error in SlideShowBegin - {e}")
+            log.error("PowerPointEventSink: Error in SlideShowBegin - %s", e)
 
     def SlideShowEnd(self, pres):
         """Called when slideshow ends.
@@ -181,7 +521,7 @@ class PowerPointEventSink(COMObject):
             if self._worker:
                 self._worker.on_slideshow_end(pres)
         except Exception as e:
-            log.error(f"PowerPointEventSink: Error in SlideShowEnd - {e}")
+            log.error("PowerPointEventSink: Error in SlideShowEnd - %s", e)
 
     def SlideShowNextSlide(self, slideShowWindow):
         """Called when slide advances in slideshow mode.
@@ -194,16 +534,15 @@ class PowerPointEventSink(COMObject):
             if self._worker and slideShowWindow:
                 try:
                     # Get slide index from slideshow window
-                    slide_index = slideShowWindow.View.Slide.SlideIndex
-                    if slide_index != self._last_slide_index:
-                        log.info(f"PowerPointEventSink: Slideshow slide changed to {slide_index}")
-                        self._last_slide_index = slide_index
-                        # v0.0.56: Pass slideshow window for notes access
-                        self._worker.on_slideshow_slide_changed(slide_index, slideShowWindow)
+                    slide_index = _get_com_path(
+                        slideShowWindow, "SlideShowWindow", "View", "Slide", "SlideIndex")
+                    # v0.0.56: Pass slideshow window for notes access
+                    # (the worker skips slides it already announced)
+                    self._worker.on_slideshow_slide_changed(slide_index, slideShowWindow)
                 except Exception as e:
-                    log.debug(f"PowerPointEventSink: Could not get slideshow slide - {e}")
+                    log.debug("PowerPointEventSink: Could not get slideshow slide - %s", e)
         except Exception as e:
-            log.error(f"PowerPointEventSink: Error in SlideShowNextSlide - {e}")
+            log.error("PowerPointEventSink: Error in SlideShowNextSlide - %s", e)
 
 
 # ============================================================================
@@ -272,28 +611,95 @@ class PowerPointWorker:
     v0.0.69: Fix discovery logging crash - handle None values in name/parent slicing.
     """
 
-    # View type constants
-    PP_VIEW_NORMAL = 9
-    PP_VIEW_SLIDE_SORTER = 5
-    PP_VIEW_NOTES = 10
-    PP_VIEW_OUTLINE = 6
-    PP_VIEW_SLIDE_MASTER = 3
-    PP_VIEW_READING = 50
+    # Connection retries while PowerPoint (or a presentation) isn't available
+    # back off exponentially between these bounds; once connected, wait forever
+    RETRY_MIN_MS = 100
+    RETRY_MAX_MS = 5000
+    # Selection changes are processed once no further change arrives for this
+    # long, so arrowing through thumbnails or a click that fires several
+    # selection events only does COM work for the last one
+    SELECTION_DEBOUNCE_S = 0.12
+    # How long a Comments pane visibility check stays valid
+    PANE_STATE_TTL_S = 1.0
+    INFINITE = 0xFFFFFFFF
 
     def __init__(self):
-        self._stop_event = threading.Event()
+        # Manual-reset Win32 event set by stop(). It is waited on alongside the
+        # message queue, so a stop request ends the wait at once and stays set.
+        self._stop_handle = _CreateEventW(None, True, False, None)
+        # Auto-reset Win32 event signalled by request_*() so the worker
+        # sleeps until there is work instead of polling every 500ms
+        self._wake_event = _CreateEventW(None, False, False, None)
+        # Wait-handle array and MSG buffer for _pump_messages, built once.
+        # The stop handle comes first so it wins when both are signalled.
+        self._wait_handles = (HANDLE * 2)(self._stop_handle, self._wake_event)
+        self._msg = MSG()
+        self._msg_ref = byref(self._msg)
         self._thread = None
         self._ppt_app = None
         self._event_sink = None
         self._event_connection = None
         self._initialized = False
+        # Open presentations, read once per connection and then kept up to
+        # date by PresentationOpen/NewPresentation/PresentationClose events.
+        # None = unknown, read Presentations.Count on next use.
+        self._presentation_count = None
+        # PowerPoint is running without a presentation and events are connected:
+        # wait for PresentationOpen/NewPresentation instead of retrying
+        self._waiting_for_presentation = False
+        # A presentation was opened but its window may not be active yet -
+        # keep retrying with backoff rather than going back to waiting
+        self._presentation_opened = False
+        # Backoff state for connection retries (see _try_initialize)
+        self._retry_delay_ms = self.RETRY_MIN_MS
+        self._retry_at = 0.0
+        # Pending requests from the main thread ("initialize", "read_notes").
+        # A set, so repeated requests before the worker runs coalesce into one.
+        self._pending_tasks = set()
+        self._task_lock = threading.Lock()
+        # Task name -> handler, built once so dispatch is a single dict lookup
+        self._task_handlers = {
+            "initialize": self._reinitialize,
+            "read_notes": self._announce_slide_notes,
+        }
+        # Latest slide announcement not yet spoken; replaced by newer ones (see _announce)
+        self._pending_announcement = None
+        self._announcement_lock = threading.Lock()
+        # Last selection of a burst, waiting out the debounce (None = nothing pending)
+        self._pending_selection = None
+        self._selection_deadline = 0.0
+        # Bumped on (re)initialize and window changes; a pending selection
+        # recorded under an older generation is stale and dropped
+        self._event_generation = 0
+        self._pending_generation = 0
         # Track last slide for duplicate detection
         self._last_announced_slide = -1
+        # Last slide announced in each other window, keyed on the window's
+        # interface pointer, so switching back to a presentation doesn't
+        # repeat its slide (cleared when a presentation closes)
+        self._announced_by_window = {}
         # v0.0.22: Store current window for correct multi-presentation support
         self._current_window = None
+        # View proxy of _current_window, fetched on first use (see _get_view)
+        self._current_view = None
+        # Slide proxy of _current_view, handed over by slide-change events or
+        # fetched on first use (see _get_slide)
+        self._current_slide = None
+        # Slide position and count for PageUp/PageDown bounds checks; None = ask COM.
+        # Rechecked against PowerPoint before refusing to move past either end.
+        self._cached_slide_index = None
+        self._cached_slide_count = None
+        # idMso that GetPressedMso accepted for the Comments pane
+        # (None = not probed yet, False = no known name works in this PowerPoint)
+        self._comments_pane_mso = None
+        # (time.monotonic() of last check, pane visible) - see _is_comments_pane_visible
+        self._pane_state = (0.0, False)
+        # Last ViewType seen by _ensure_normal_view; None forces a COM read
+        self._last_view_type = None
         # v0.0.23: Queue for navigation requests from main thread
-        self._nav_request = None  # Will be direction: 1 for next, -1 for previous
-        self._read_notes_request = False  # v0.0.49: Request to read slide notes
+        # Directions (1 next, -1 previous) in keypress order. deque append and
+        # popleft are atomic, so the main thread can add while the worker drains.
+        self._nav_requests = deque(maxlen=16)
         self._from_comments_navigation = False  # v0.0.50: Track if nav from Comments pane
         self._has_received_focus = False  # v0.0.54: Track if app has received focus
         self._in_slideshow = False  # v0.0.56: Track if in presentation mode
@@ -318,29 +724,95 @@ class PowerPointWorker:
             self._thread.start()
             log.info("PowerPoint worker thread started")
         except Exception as e:
-            log.error(f"Failed to start worker thread: {e}")
+            log.error("Failed to start worker thread: %s", e)
 
     def stop(self, timeout=5):
         """Stop the thread gracefully."""
         log.info("PowerPoint worker thread stopping...")
-        self._stop_event.set()
+        if self._stop_handle:
+            _SetEvent(self._stop_handle)
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=timeout)
             if self._thread.is_alive():
+                # Thread may still wait on the handle - leave it open
                 log.warning("PowerPoint worker thread did not stop within timeout")
-            else:
-                log.info("PowerPoint worker thread stopped cleanly")
+                return
+            log.info("PowerPoint worker thread stopped cleanly")
+        if self._wake_event:
+            _CloseHandle(self._wake_event)
+            self._wake_event = None
+        if self._stop_handle:
+            _CloseHandle(self._stop_handle)
+            self._stop_handle = None
+
+    def _wake(self):
+        """Wake the worker thread so it processes pending requests immediately."""
+        if self._wake_event:
+            _SetEvent(self._wake_event)
+
+    def _queue_task(self, task_name):
+        """Queue a task for the worker thread, coalescing duplicates.
+
+        A task that is already pending is not queued again, so rapid focus
+        changes (alt-tab, dialogs closing) cause one re-initialization
+        rather than one per event.
+
+        Args:
+            task_name: "initialize" or "read_notes"
+        """
+        with self._task_lock:
+            if task_name in self._pending_tasks:
+                log.debug("Worker: '%s' already pending - coalesced", task_name)
+                return
+            self._pending_tasks.add(task_name)
+        self._wake()
+
+    @staticmethod
+    def _ms_until(deadline):
+        """Milliseconds from now until a time.monotonic() deadline (0 if passed)."""
+        return max(0, int((deadline - time.monotonic()) * 1000) + 1)
+
+    def _try_initialize(self):
+        """Run the initialize task and schedule the next retry if it failed.
+
+        Retries back off from RETRY_MIN_MS to RETRY_MAX_MS so a closed
+        PowerPoint (or its splash screen) isn't queried several times a second.
+        """
+        self._execute_task("initialize")
+        if self._initialized:
+            self._retry_delay_ms = self.RETRY_MIN_MS
+        elif self._waiting_for_presentation:
+            log.debug("Worker: Waiting for a presentation to be opened")
+        else:
+            self._retry_at = time.monotonic() + self._retry_delay_ms / 1000
+            log.debug("Worker: Next connection attempt in %d ms", self._retry_delay_ms)
+            self._retry_delay_ms = min(self._retry_delay_ms * 2, self.RETRY_MAX_MS)
+
+    def _execute_task(self, task_name):
+        """Run the handler registered for task_name (worker thread only)."""
+        handler = self._task_handlers.get(task_name)
+        if handler is None:
+            log.warning("Worker: Unknown task '%s'", task_name)
+            return
+        handler()
+
+    def _take_pending_tasks(self):
+        """Remove and return all pending task names (worker thread only)."""
+        with self._task_lock:
+            tasks = self._pending_tasks
+            self._pending_tasks = set()
+        return tasks
 
     def request_initialize(self):
         """Request initialization from main thread.
 
         This is called from event_appModule_gainFocus.
-        Sets a flag that the worker thread will pick up.
+        Queues an "initialize" task that the worker thread will pick up.
         v0.0.54: Also sets _has_received_focus to enable initial slide announcement.
         """
         log.info("Worker: Initialize requested (app has focus)")
         self._has_received_focus = True  # v0.0.54: App has focus, ok to announce
-        self._initialized = False  # Force re-initialization
+        self._queue_task("initialize")
 
     def request_navigate(self, direction, from_comments_pane=False):
         """Request slide navigation from main thread.
@@ -353,9 +825,10 @@ class PowerPointWorker:
             direction: 1 for next slide, -1 for previous slide
             from_comments_pane: True if navigation triggered from Comments pane
         """
-        log.info(f"Worker: Navigation requested (direction={direction}, from_comments={from_comments_pane})")
-        self._nav_request = direction
+        log.info("Worker: Navigation requested (direction=%s, from_comments=%s)", direction, from_comments_pane)
+        self._nav_requests.append(direction)
         self._from_comments_navigation = from_comments_pane
+        self._wake()
 
     def request_read_notes(self):
         """Request to read slide notes from main thread.
@@ -363,7 +836,7 @@ class PowerPointWorker:
         v0.0.49: Queues request for worker thread to read and announce notes.
         """
         log.info("Worker: Read notes requested")
-        self._read_notes_request = True
+        self._queue_task("read_notes")
 
     def _run(self):
         """Main thread loop - runs in background."""
@@ -372,88 +845,154 @@ class PowerPointWorker:
             CoInitializeEx(COINIT_APARTMENTTHREADED)
             log.info("PowerPoint worker: COM initialized (STA)")
         except Exception as e:
-            log.error(f"PowerPoint worker: Failed to initialize COM - {e}")
+            log.error("PowerPoint worker: Failed to initialize COM - %s", e)
             return
 
         try:
             # Initial connection attempt
-            self._initialize_com()
+            self._try_initialize()
 
             # Main loop - process Windows messages to receive COM events
-            while not self._stop_event.is_set():
+            while True:
                 try:
                     # Pump Windows messages to receive COM events
                     # This is REQUIRED for COM events to be delivered
-                    self._pump_messages(timeout_ms=500)
-
-                    # Check if we need to reinitialize (e.g., after focus regained)
-                    if not self._initialized:
-                        self._initialize_com()
+                    # Blocks until a COM message arrives or _wake() is called;
+                    # only times out for the next connection retry or debounce
+                    if self._initialized or self._waiting_for_presentation:
+                        timeout_ms = self.INFINITE
+                    else:
+                        timeout_ms = self._ms_until(self._retry_at)
+                    if self._pending_selection is not None:
+                        # Wake up when the pending selection change is due
+                        timeout_ms = min(timeout_ms, self._ms_until(self._selection_deadline))
+                    if self._pump_messages(timeout_ms=timeout_ms):
+                        break
+
+                    tasks = self._take_pending_tasks()
+
+                    # Reinitialize after focus regained, or retry (with backoff) until
+                    # connected. Runs first so later tasks see a live connection.
+                    if "initialize" in tasks:
+                        tasks.discard("initialize")
+                        # Fresh request from the user - start backing off from scratch
+                        self._retry_delay_ms = self.RETRY_MIN_MS
+                        self._try_initialize()
+                    elif (not self._initialized and not self._waiting_for_presentation
+                            and time.monotonic() >= self._retry_at):
+                        self._try_initialize()
+
+                    if (self._pending_selection is not None
+                            and time.monotonic() >= self._selection_deadline):
+                        self._process_selection_change()
 
                     # v0.0.23: Check for navigation requests from main thread
-                    if self._nav_request is not None:
-                        direction = self._nav_request
-                        self._nav_request = None  # Clear before processing
-                        self._navigate_slide(direction)
+                    # Drain all queued presses into one move so fast PageDown
+                    # repeats aren't lost but only the final slide is visited
+                    offset = 0
+                    while self._nav_requests:
+                        offset += self._nav_requests.popleft()
+                    if offset:
+                        self._navigate_slide(offset)
+
+                    # Remaining requests from main thread (v0.0.49: read notes)
+                    for task_name in tasks:
+                        self._execute_task(task_name)
 
-                    # v0.0.49: Check for read notes requests from main thread
-                    if self._read_notes_request:
-                        self._read_notes_request = False
-                        self._announce_slide_notes()
-
-                except Exception as e:
-                    log.error(f"Worker thread error: {e}")
+                except Exception:
+                    log.exception("Worker thread error")
 
         finally:
-            # Clean up event connection
+            # Clean up event connection and release the sink before COM goes away
             self._disconnect_events()
+            self._event_sink = None
             # Clean up COM
             self._ppt_app = None
             CoUninitialize()
             log.info("PowerPoint worker: COM uninitialized, thread exiting")
 
-    def _pump_messages(self, timeout_ms=500):
+    def _pump_messages(self, timeout_ms=INFINITE):
         """Pump Windows messages to receive COM events.
 
         COM events are delivered via Windows messages, so we need to
         process the message queue for events to fire.
 
         Args:
-            timeout_ms: How long to wait for messages (milliseconds)
+            timeout_ms: How long to wait for messages or the wake event
+                (milliseconds, INFINITE to wait until woken)
+
+        Returns:
+            True if stop() was called and the worker should exit
         """
         try:
-            # Use MsgWaitForMultipleObjects to wait for messages or timeout
-            from ctypes import windll, byref, c_uint
-            from ctypes.wintypes import MSG
-
-            user32 = windll.user32
-
-            # Wait for messages with timeout
-            QS_ALLINPUT = 0x04FF
-            WAIT_TIMEOUT = 0x00000102
-
-            result = user32.MsgWaitForMultipleObjects(
-                0,      # nCount - no handles
-                None,   # pHandles
-                False,  # bWaitAll
+            # Wait for stop(), messages, a _wake() signal, or the timeout
+            result = _MsgWaitForMultipleObjectsEx(
+                2,                    # nCount - the stop and wake events
+                self._wait_handles,   # pHandles
                 timeout_ms,
-                QS_ALLINPUT
+                QS_COM_MESSAGES,
+                MWMO_INPUTAVAILABLE
             )
-
-            # Process any pending messages
-            msg = MSG()
-            PM_REMOVE = 0x0001
-            while user32.PeekMessageW(byref(msg), None, 0, 0, PM_REMOVE):
-                user32.TranslateMessage(byref(msg))
-                user32.DispatchMessageW(byref(msg))
+            if result == WAIT_OBJECT_0:
+                return True
+
+            # Process any pending messages. The MSG buffer is reused - this
+            # method is only ever entered from _run, never re-entrantly.
+            peek = _PeekMessageW
+            translate = _TranslateMessage
+            dispatch = _DispatchMessageW
+            msg_ref = self._msg_ref
+            while peek(msg_ref, None, 0, 0, PM_REMOVE):
+                translate(msg_ref)
+                dispatch(msg_ref)
 
         except Exception as e:
-            log.debug(f"Message pump error (non-critical): {e}")
+            log.debug("Message pump error (non-critical): %s", e)
+        return False
+
+    def _forget_view_state(self):
+        """Drop cached view and slide state that may be stale after focus loss."""
+        self._event_generation += 1
+        # The user may have changed view or edited slides while PowerPoint
+        # was in the background
+        self._last_view_type = None
+        self._current_slide = None
+        self._cached_slide_index = None
+        self._cached_slide_count = None
+
+    def _reinitialize(self):
+        """Handle the "initialize" task.
+
+        When the worker is already connected (e.g. Alt-Tab back to the same
+        PowerPoint), the existing app reference and event connection are
+        kept and only the window is refreshed. Falls back to a full
+        _initialize_com() if PowerPoint no longer answers or has no window.
+        """
+        if self._initialized and self._ppt_app and self._event_connection:
+            # Also serves as the liveness check - returns None if the call fails
+            window = self._get_active_window()
+            if window:
+                log.info("Worker: Still connected to PowerPoint - refreshing window")
+                self._forget_view_state()
+                self._set_window(window)
+                self._ensure_normal_view()
+                # Skips the announcement if this slide was already announced
+                self._check_initial_slide()
+                return
+        self._initialize_com()
 
     def _initialize_com(self):
         """Connect to PowerPoint and set up event handling."""
         try:
             log.info("Worker: Attempting to connect to PowerPoint...")
+            self._waiting_for_presentation = False
+            self._forget_view_state()
+            # May be a different PowerPoint instance - count its presentations
+            # afresh. The per-window announcement record is kept: after a
+            # transient failure the same window comes back, and its slide has
+            # already been announced.
+            self._presentation_count = None
+            self._set_window(None)
 
             self._ppt_app = comHelper.getActiveObject(
                 "PowerPoint.Application",
@@ -461,8 +1000,13 @@ class PowerPointWorker:
             )
             log.info("Worker: Connected to PowerPoint COM")
 
-            if self._has_active_presentation():
+            window = self._get_active_window()
+            # Reuse the window we just fetched instead of asking for ActiveWindow
+            # again in every helper; focus may have moved to another presentation
+            self._set_window(window)
+            if window:
                 log.info("Worker: Active presentation found")
+                self._presentation_opened = False
                 self._ensure_normal_view()
 
                 # Set up COM event handling
@@ -473,16 +1017,29 @@ class PowerPointWorker:
 
                 self._initialized = True
             else:
-                log.info("Worker: No active presentation - will retry on next focus")
                 self._initialized = False
+                # Nothing changes until a presentation is opened, so listen for
+                # that rather than polling GetActiveObject
+                self._connect_events()
+                self._waiting_for_presentation = (
+                    self._event_connection is not None and not self._presentation_opened
+                )
+                if self._waiting_for_presentation:
+                    log.info("Worker: No active presentation - waiting for one to open")
+                else:
+                    log.info("Worker: No active presentation - will retry")
 
         except OSError as e:
-            log.info(f"Worker: PowerPoint COM not available - {e}")
+            log.info("Worker: PowerPoint COM not available - %s", e)
             self._ppt_app = None
+            self._comments_pane_mso = None
+            self._set_window(None)
             self._initialized = False
-        except Exception as e:
-            log.error(f"Worker: Initialize failed - {e}")
+        except Exception:
+            log.exception("Worker: Initialize failed")
             self._ppt_app = None
+            self._comments_pane_mso = None
+            self._set_window(None)
             self._initialized = False
 
     def _connect_events(self):
@@ -499,9 +1056,11 @@ class PowerPointWorker:
             # First disconnect any existing connection
             self._disconnect_events()
 
-            # Create event sink with our locally-defined EApplication interface
-            self._event_sink = PowerPointEventSink(self)
-            log.info("Worker: Created PowerPointEventSink")
+            # Create the event sink once and reuse it across reconnects;
+            # it keeps no per-connection state
+            if self._event_sink is None:
+                self._event_sink = PowerPointEventSink(self)
+                log.info("Worker: Created PowerPointEventSink")
 
             # Get IUnknown from sink for advise connection
             sink_iunknown = self._event_sink.QueryInterface(comtypes.IUnknown)
@@ -515,27 +1074,28 @@ class PowerPointWorker:
                 sink_iunknown
             )
 
-            log.info("Worker: Connected to PowerPoint events via _AdviseConnection")
+            log.info("Worker: Connected to PowerPoint events via _AdviseConnection (cookie %s)",
+                     self._event_connection.cookie)
 
-        except Exception as e:
-            log.error(f"Worker: Failed to connect to PowerPoint events - {e}")
-            import traceback
-            log.error(f"Worker: Traceback: {traceback.format_exc()}")
-            self._event_sink = None
+        except Exception:
+            log.exception("Worker: Failed to connect to PowerPoint events")
             self._event_connection = None
 
     def _disconnect_events(self):
         """Disconnect from PowerPoint events."""
-        if self._event_connection:
+        conn = self._event_connection
+        self._event_connection = None
+        # May be a different PowerPoint next time - probe the idMso again
+        self._comments_pane_mso = None
+        if conn:
             try:
-                # The connection object should be released
-                del self._event_connection
-                self._event_connection = None
-                log.info("Worker: Disconnected from PowerPoint events")
+                cookie = conn.cookie
+                # Unadvise here on the STA thread rather than leaving it to
+                # _AdviseConnection.__del__, which may run on any thread
+                conn.disconnect()
+                log.info("Worker: Disconnected from PowerPoint events (cookie %s)", cookie)
             except Exception as e:
-                log.debug(f"Worker: Error disconnecting events - {e}")
-
-        self._event_sink = None
+                log.debug("Worker: Error disconnecting events - %s", e)
 
     def _check_initial_slide(self):
         """Check and announce comments on the initial slide.
@@ -551,7 +1111,7 @@ class PowerPointWorker:
             if current_index <= 0:
                 return
 
-            log.info(f"Worker: Initial slide is {current_index}, last announced was {self._last_announced_slide}")
+            log.info("Worker: Initial slide is %s, last announced was %s", current_index, self._last_announced_slide)
 
             # v0.0.54: Don't announce if app hasn't received focus yet
             # v0.0.60: Also don't mark as announced, so we can announce on first real focus
@@ -567,40 +1127,131 @@ class PowerPointWorker:
             self._last_announced_slide = current_index
             self._announce_slide_comments()
         except Exception as e:
-            log.debug(f"Worker: Error checking initial slide - {e}")
+            log.debug("Worker: Error checking initial slide - %s", e)
 
-    def on_slide_changed_event(self, slide_index, window=None):
-        """Called by event sink when slide changes.
+    def on_slide_changed_event(self, slide_index, window=None, view=None, slide=None):
+        """Called by event sink with the slide of each processed selection change.
 
-        This runs on the COM thread (our worker thread).
+        This runs on the COM thread (our worker thread). Only announces when
+        the slide differs from the last one announced.
 
         Args:
             slide_index: New slide index (1-based)
             window: The specific DocumentWindow that triggered the event (v0.0.22)
+            view: That window's View, if the sink already read it
+            slide: The View's current Slide, if the sink already read it
         """
-        log.info(f"Worker: Slide change event received - slide {slide_index}")
-
         # v0.0.22: Store the window for use by other methods
         if window:
-            self._current_window = window
+            self._set_window(window)
             log.debug("Worker: Using specific window from event")
+            # Reuse what the sink read so the announcement doesn't walk
+            # window.View.Slide again
+            if view is not None:
+                self._current_view = view
+            self._current_slide = slide
         elif not self._current_window and self._ppt_app:
-            self._current_window = self._ppt_app.ActiveWindow
+            self._get_window()
             log.debug("Worker: Falling back to ActiveWindow")
 
-        # Avoid duplicate announcements
+        self._cached_slide_index = slide_index
+
+        # The only duplicate check for selection changes: most of them stay
+        # on the slide already announced, so return before any COM work
         if slide_index == self._last_announced_slide:
-            log.debug(f"Worker: Ignoring duplicate slide {slide_index}")
+            log.debug("Worker: Ignoring duplicate slide %s", slide_index)
             return
 
+        log.info("Worker: Slide changed to %s", slide_index)
         self._last_announced_slide = slide_index
 
-        # Ensure Normal view
-        self._ensure_normal_view()
+        # Ensure Normal view (slide changes rarely change the view, so trust the cache)
+        self._ensure_normal_view(use_cache=True)
 
         # Announce comments on new slide
         self._announce_slide_comments()
 
+    def on_selection_changed(self, sel):
+        """Called by event sink for every WindowSelectionChange.
+
+        Only remembers the selection and restarts the debounce; the COM walk
+        to its slide runs in _process_selection_change for the last one.
+        """
+        self._pending_selection = sel
+        self._pending_generation = self._event_generation
+        self._selection_deadline = time.monotonic() + self.SELECTION_DEBOUNCE_S
+
+    def _process_selection_change(self):
+        """Look up the slide of the pending selection once its debounce has expired."""
+        sel = self._pending_selection
+        self._pending_selection = None
+
+        # Recorded before a reinitialize or window switch - the initial slide
+        # check or a newer selection event covers the current slide instead
+        if self._pending_generation != self._event_generation:
+            log.debug("Worker: Dropping stale selection change")
+            return
+
+        if self._event_sink is not None:
+            self._event_sink.process_selection(sel)
+
+    def on_presentation_count_changed(self, delta):
+        """Called by event sink when a presentation opens (+1) or closes (-1)."""
+        if self._presentation_count is not None:
+            self._presentation_count = max(0, self._presentation_count + delta)
+            log.debug("Worker: %d presentation(s) open", self._presentation_count)
+        if delta < 0:
+            # Don't keep the closing presentation's windows alive
+            self._announced_by_window.clear()
+            self._presentation_opened = False
+        elif delta > 0:
+            # Its window may not be active yet - until one is found,
+            # _initialize_com keeps to the backoff retries instead of waiting
+            self._presentation_opened = True
+            if self._waiting_for_presentation:
+                log.info("Worker: Presentation opened - connecting")
+                self._connect_soon()
+
+    def _connect_soon(self):
+        """Stop waiting for a presentation and try to connect on the next loop pass."""
+        self._waiting_for_presentation = False
+        self._retry_delay_ms = self.RETRY_MIN_MS
+        self._retry_at = 0.0
+
+    def on_window_changed(self):
+        """Called by event sink when the active window changes or a presentation closes.
+
+        Forgets the cached window and View; the next helper call falls back
+        to ActiveWindow until a selection change names the window again.
+        """
+        log.debug("Worker: Window changed - dropping cached window and view")
+        self._event_generation += 1
+        self._set_window(None)
+        self._last_view_type = None
+
+    def on_window_activated(self):
+        """Called by event sink when a document window is activated.
+
+        Besides dropping the cached window, ends a wait for a presentation:
+        the window may become active only after PresentationOpen/NewPresentation.
+        """
+        self.on_window_changed()
+        if self._waiting_for_presentation:
+            log.info("Worker: Window activated - connecting")
+            self._presentation_opened = True
+            self._connect_soon()
+
+    def on_view_unknown(self):
+        """Called by event sink when the current view has no single slide.
+
+        That happens outside Normal view (e.g. Slide Sorter), so the next
+        slide change must read ViewType again rather than trust the cache.
+        The window may also have closed, so its View is fetched again too.
+        """
+        self._last_view_type = None
+        self._current_view = None
+        self._current_slide = None
+
     def on_slideshow_begin(self, wn):
         """Called when slideshow starts.
 
@@ -620,7 +1271,7 @@ class PowerPointWorker:
             self._cache_slideshow_slide_data(wn)
             log.info("Worker: Cached first slide data on slideshow begin")
         except Exception as e:
-            log.error(f"Worker: Error caching first slide - {e}")
+            log.error("Worker: Error caching first slide - %s", e)
 
     def on_slideshow_end(self, pres):
         """Called when slideshow ends.
@@ -632,6 +1283,10 @@ class PowerPointWorker:
         Args:
             pres: Presentation object (IDispatch)
         """
+        # The show may leave its window in a different view - read View again
+        self._current_view = None
+        self._current_slide = None
+        self._last_view_type = None
         if self._in_slideshow:
             log.info("Worker: Slideshow ended - exiting presentation mode")
             self._in_slideshow = False
@@ -658,14 +1313,14 @@ class PowerPointWorker:
             slide_index: New slide index (1-based)
             slideshow_window: SlideShowWindow object for notes access
         """
-        log.info(f"Worker: Slideshow slide changed to {slide_index}")
+        log.info("Worker: Slideshow slide changed to %s", slide_index)
 
         # Store slideshow window for notes access (used by CustomSlideShowWindow._get_name())
         self._slideshow_window = slideshow_window
 
         # Avoid duplicate announcements
         if slide_index == self._last_announced_slide:
-            log.debug(f"Worker: Ignoring duplicate slideshow slide {slide_index}")
+            log.debug("Worker: Ignoring duplicate slideshow slide %s", slide_index)
             return
 
         self._last_announced_slide = slide_index
@@ -675,21 +1330,32 @@ class PowerPointWorker:
         try:
             self._cache_slideshow_slide_data(slideshow_window)
         except Exception as e:
-            log.error(f"Worker: Error caching slideshow slide data - {e}")
+            log.error("Worker: Error caching slideshow slide data - %s", e)
 
         log.debug("Worker: Slideshow slide tracking updated (announcement via window name)")
 
-    def _has_active_presentation(self):
-        """Check if there's an active presentation open."""
+    def _get_active_window(self):
+        """Return the active DocumentWindow, or None if no presentation is open.
+
+        The presentation count is only read over COM when it is unknown or
+        no event connection is keeping it current.
+        """
         try:
-            if self._ppt_app:
-                if self._ppt_app.Presentations.Count > 0:
-                    if self._ppt_app.ActiveWindow:
-                        return True
-            return False
+            app = self._ppt_app
+            if app:
+                count = self._presentation_count
+                if count is None or not self._event_connection:
+                    count = _get_com_path(app, "Application", "Presentations", "Count")
+                    self._presentation_count = count
+                if count > 0:
+                    return _get_com_path(app, "Application", "ActiveWindow")
+            return None
         except Exception as e:
-            log.debug(f"No active presentation: {e}")
-            return False
+            # The count may have drifted (e.g. a close cancelled at the save
+            # prompt still fires PresentationClose) - read it again next time
+            self._presentation_count = None
+            log.debug("No active presentation: %s", e)
+            return None
 
     def _is_slideshow_running(self):
         """Check if a slideshow is actually running using COM.
@@ -700,10 +1366,10 @@ class PowerPointWorker:
         try:
             if self._ppt_app:
                 count = self._ppt_app.SlideShowWindows.Count
-                log.debug(f"Worker: SlideShowWindows.Count = {count}")
+                log.debug("Worker: SlideShowWindows.Count = %s", count)
                 return count > 0
         except Exception as e:
-            log.debug(f"Worker: Could not check slideshow state - {e}")
+            log.debug("Worker: Could not check slideshow state - %s", e)
         return False
 
     def _cache_slideshow_slide_data(self, slideshow_window):
@@ -721,92 +1387,160 @@ class PowerPointWorker:
         try:
             slide = slideshow_window.View.Slide
             slide_index = slide.SlideIndex
-            log.info(f"Worker: Caching slideshow data for slide {slide_index}")
+            log.info("Worker: Caching slideshow data for slide %s", slide_index)
 
             # Cache slide title
             self._slideshow_title = ""
             try:
-                if slide.Shapes.HasTitle:
-                    title_shape = slide.Shapes.Title
-                    if title_shape and title_shape.HasTextFrame:
-                        text_frame = title_shape.TextFrame
-                        if text_frame.HasText:
-                            self._slideshow_title = text_frame.TextRange.Text.strip()
+                shapes = _get_com_path(slide, "Slide", "Shapes")
+                if _get_com_path(shapes, "Shapes", "HasTitle"):
+                    title_shape = _get_com_path(shapes, "Shapes", "Title")
+                    if title_shape:
+                        self._slideshow_title = _get_shape_text(title_shape)
             except Exception as e:
-                log.debug(f"Worker: Could not get slideshow title - {e}")
+                log.debug("Worker: Could not get slideshow title - %s", e)
 
             # Cache notes status (check for **** markers)
             self._slideshow_has_notes = False
             try:
                 notes_page = slide.NotesPage
                 placeholder = notes_page.Shapes.Placeholders(2)
-                if placeholder.HasTextFrame:
-                    text_frame = placeholder.TextFrame
-                    if text_frame.HasText:
-                        notes_text = text_frame.TextRange.Text.strip()
-                        self._slideshow_has_notes = '****' in notes_text
+                self._slideshow_has_notes = '****' in _get_shape_text(placeholder)
             except Exception as e:
-                log.debug(f"Worker: Could not check slideshow notes - {e}")
+                log.debug("Worker: Could not check slideshow notes - %s", e)
 
             # Cache comment count
             self._slideshow_comment_count = 0
             try:
                 self._slideshow_comment_count = slide.Comments.Count
             except Exception as e:
-                log.debug(f"Worker: Could not get slideshow comments - {e}")
+                log.debug("Worker: Could not get slideshow comments - %s", e)
 
             self._slideshow_data_ready = True
-            log.info(f"Worker: Slideshow cache ready - title='{self._slideshow_title[:30] if self._slideshow_title else ''}', "
-                    f"has_notes={self._slideshow_has_notes}, comments={self._slideshow_comment_count}")
+            log.info("Worker: Slideshow cache ready - title='%s', has_notes=%s, comments=%s",
+                     (self._slideshow_title or "")[:30], self._slideshow_has_notes,
+                     self._slideshow_comment_count)
 
         except Exception as e:
-            log.error(f"Worker: Error caching slideshow data - {e}")
+            log.error("Worker: Error caching slideshow data - %s", e)
             self._slideshow_data_ready = False
 
+    def _set_window(self, window):
+        """Store the current window, dropping its cached View if the window changed."""
+        old_key = getattr(self._current_window, "_comobj", self._current_window)
+        new_key = getattr(window, "_comobj", window)
+        if window is None or old_key != new_key:
+            self._current_view = None
+            self._current_slide = None
+            self._cached_slide_index = None
+            self._cached_slide_count = None
+            # Duplicate detection is per window
+            if old_key is not None:
+                self._announced_by_window[old_key] = self._last_announced_slide
+            if new_key is not None:
+                self._last_announced_slide = self._announced_by_window.pop(new_key, -1)
+        self._current_window = window
+
     def _get_window(self):
-        """Get the current window (v0.0.22: prefer stored window over ActiveWindow)."""
+        """Get the current window (v0.0.22: prefer stored window over ActiveWindow).
+
+        An ActiveWindow fallback is kept as the current window, so it is
+        only fetched again after a window activation or presentation close.
+        """
         if self._current_window:
             return self._current_window
         if self._ppt_app:
-            return self._ppt_app.ActiveWindow
+            self._set_window(_get_com_path(self._ppt_app, "Application", "ActiveWindow"))
+            return self._current_window
         return None
 
-    def _get_current_view(self):
-        """Get current PowerPoint view type."""
-        try:
+    def _get_view(self):
+        """Get the View of the current window.
+
+        Cached until the window changes, the view type is switched, or
+        PowerPoint reports a window activation or presentation close.
+        """
+        if self._current_view is None:
             window = self._get_window()
             if window:
-                view_type = window.ViewType
-                log.debug(f"View type detected: {view_type}")
-                return view_type
-        except Exception as e:
-            log.debug(f"Failed to get view type: {e}")
-        return None
+                self._current_view = _get_com_path(window, "DocumentWindow", "View")
+        return self._current_view
+
+    def _get_slide(self):
+        """Get the current Slide of the current window's View.
+
+        Cached until the next slide change, navigation or window change.
+        """
+        if self._current_slide is None:
+            view = self._get_view()
+            if view:
+                self._current_slide = _get_com_path(view, "View", "Slide")
+        return self._current_slide
 
-    def _ensure_normal_view(self):
-        """Switch to Normal view if not already there."""
+    def _ensure_normal_view(self, use_cache=False):
+        """Switch to Normal view if not already there.
+
+        Looks up the window once and reads ViewType once, since each is a
+        cross-process COM call.
+
+        Args:
+            use_cache: Skip the COM read if Normal view was the last view seen.
+                The cache is cleared on every (re)initialize.
+        """
+        if use_cache and self._last_view_type == PP_VIEW_NORMAL:
+            return False
         try:
             window = self._get_window()
-            current_view = self._get_current_view()
-            if current_view is not None and current_view != self.PP_VIEW_NORMAL:
-                log.info(f"Switching view from {current_view} to Normal")
-                if window:
-                    window.ViewType = self.PP_VIEW_NORMAL
-                    self._announce("Switched to Normal view")
-                    return True
-            else:
-                log.debug("Already in Normal view")
+            if not window:
+                return False
+            current_view = window.ViewType
+            self._last_view_type = current_view
+            if current_view != PP_VIEW_NORMAL:
+                log.info("Switching view from %s to Normal", _VIEW_NAMES.get(current_view, current_view))
+                window.ViewType = PP_VIEW_NORMAL
+                self._last_view_type = PP_VIEW_NORMAL
+                self._current_view = None
+                self._announce("Switched to Normal view")
+                return True
+            log.debug("Already in Normal view")
         except Exception as e:
-            log.debug(f"Failed to switch view: {e}")
+            # ViewType is readable on any live window - the cached one is likely
+            # closed, so fall back to ActiveWindow until the next event
+            self._last_view_type = None
+            self._set_window(None)
+            log.debug("Failed to switch view: %s", e)
         return False
 
-    def _announce(self, message):
-        """Safely announce message on main thread."""
+    def _announce(self, message, coalesce=False):
+        """Safely announce message on main thread.
+
+        Args:
+            message: Text to speak
+            coalesce: True for slide announcements - while one is still
+                waiting for the main thread a newer one replaces it, so fast
+                slide changes don't queue speech for slides already left
+                behind. Other messages are always spoken.
+        """
         try:
-            log.info(f"Worker: Announcing '{message}'")
-            queueFunction(eventQueue, ui.message, message)
+            log.info("Worker: Announcing '%s'", message)
+            if not coalesce:
+                queueFunction(eventQueue, ui.message, message, **_QUEUE_IMMEDIATE)
+                return
+            with self._announcement_lock:
+                scheduled = self._pending_announcement is not None
+                self._pending_announcement = message
+            if not scheduled:
+                queueFunction(eventQueue, self._flush_announcement, **_QUEUE_IMMEDIATE)
         except Exception as e:
-            log.error(f"Failed to queue announcement: {e}")
+            log.error("Failed to queue announcement: %s", e)
+
+    def _flush_announcement(self):
+        """Speak the latest pending slide announcement (runs on NVDA's main thread)."""
+        with self._announcement_lock:
+            message = self._pending_announcement
+            self._pending_announcement = None
+        if message:
+            ui.message(message)
 
     def _cancel_and_announce(self, message):
         """Cancel current speech and announce message on main thread.
@@ -815,23 +1549,34 @@ class PowerPointWorker:
         with our prefix + slide title combined message.
         """
         try:
-            log.info(f"Worker: Cancel+Announce '{message}'")
+            log.info("Worker: Cancel+Announce '%s'", message)
             # Queue cancel followed by our message
             queueFunction(eventQueue, speech.cancelSpeech)
             queueFunction(eventQueue, ui.message, message)
         except Exception as e:
-            log.error(f"Failed to queue cancel+announcement: {e}")
+            log.error("Failed to queue cancel+announcement: %s", e)
 
     def _get_current_slide_index(self):
         """Get current slide index (1-based)."""
         try:
-            window = self._get_window()
-            if window:
-                return window.View.Slide.SlideIndex
+            view = self._get_view()
+            if view:
+                # Always asks PowerPoint; refreshes the cached Slide on the way
+                self._current_slide = _get_com_path(view, "View", "Slide")
+                self._cached_slide_index = _get_com_path(self._current_slide, "Slide", "SlideIndex")
+                return self._cached_slide_index
         except Exception as e:
-            log.debug(f"Worker: Could not get slide index - {e}")
+            log.debug("Worker: Could not get slide index - %s", e)
         return -1
 
+    def _get_slide_count(self):
+        """Get the number of slides in the current window's presentation (and cache it)."""
+        window = self._get_window()
+        self._cached_slide_count = _get_com_path(
+            window, "DocumentWindow", "Presentation", "Slides", "Count"
+        )
+        return self._cached_slide_count
+
     def _get_slide_title(self):
         """Get the title text of the current slide.
 
@@ -839,17 +1584,15 @@ class PowerPointWorker:
         Returns empty string if slide has no title placeholder or title is empty.
         """
         try:
-            window = self._get_window()
-            if window:
-                slide = window.View.Slide
-                if slide.Shapes.HasTitle:
-                    title_shape = slide.Shapes.Title
-                    if title_shape and title_shape.HasTextFrame:
-                        text_frame = title_shape.TextFrame
-                        if text_frame.HasText:
-                            return text_frame.TextRange.Text.strip()
+            slide = self._get_slide()
+            if slide:
+                shapes = _get_com_path(slide, "Slide", "Shapes")
+                if _get_com_path(shapes, "Shapes", "HasTitle"):
+                    title_shape = _get_com_path(shapes, "Shapes", "Title")
+                    if title_shape:
+                        return _get_shape_text(title_shape)
         except Exception as e:
-            log.debug(f"Worker: Could not get slide title - {e}")
+            log.debug("Worker: Could not get slide title - %s", e)
         return ""
 
     def _get_slide_notes(self):
@@ -875,32 +1618,30 @@ class PowerPointWorker:
                 try:
                     slide = self._slideshow_window.View.Slide
                     source = "SlideShowWindow"
-                    log.debug(f"Worker: Getting notes from SlideShowWindow (slide {slide.SlideIndex})")
+                    log.debug("Worker: Getting notes from SlideShowWindow")
                 except Exception as e:
-                    log.debug(f"Worker: Could not get slide from SlideShowWindow - {e}")
+                    log.debug("Worker: Could not get slide from SlideShowWindow - %s", e)
 
             # Fall back to normal window
             if not slide:
-                window = self._get_window()
-                if window:
-                    slide = window.View.Slide
+                slide = self._get_slide()
+                if slide:
                     source = "normal window"
-                    log.debug(f"Worker: Getting notes from normal window (slide {slide.SlideIndex})")
+                    log.debug("Worker: Getting notes from normal window")
 
             if slide:
-                slide_idx = slide.SlideIndex
+                # SlideIndex is only read for the debug lines below
+                slide_idx = slide.SlideIndex if log.isEnabledFor(logging.DEBUG) else None
                 notes_page = slide.NotesPage
                 # Placeholder 2 is the notes body text
                 placeholder = notes_page.Shapes.Placeholders(2)
-                if placeholder.HasTextFrame:
-                    text_frame = placeholder.TextFrame
-                    if text_frame.HasText:
-                        notes_text = text_frame.TextRange.Text.strip()
-                        log.debug(f"Worker: Got notes for slide {slide_idx} from {source} ({len(notes_text)} chars)")
-                        return notes_text
-                log.debug(f"Worker: No notes text for slide {slide_idx} from {source}")
+                notes_text = _get_shape_text(placeholder)
+                if notes_text:
+                    log.debug("Worker: Got notes for slide %s from %s (%s chars)", slide_idx, source, len(notes_text))
+                    return notes_text
+                log.debug("Worker: No notes text for slide %s from %s", slide_idx, source)
         except Exception as e:
-            log.debug(f"Worker: Could not get slide notes - {e}")
+            log.debug("Worker: Could not get slide notes - %s", e)
         return ""
 
     def _has_meeting_notes(self):
@@ -913,10 +1654,10 @@ class PowerPointWorker:
         """
         notes = self._get_slide_notes()
         has_markers = '****' in notes if notes else False
-        log.debug(f"Worker: _has_meeting_notes check - in_slideshow={self._in_slideshow}, "
-                  f"notes_length={len(notes) if notes else 0}, has_markers={has_markers}")
+        log.debug("Worker: _has_meeting_notes check - in_slideshow=%s, notes_length=%d, has_markers=%s",
+                  self._in_slideshow, len(notes) if notes else 0, has_markers)
         if notes:
-            log.debug(f"Worker: Notes preview: {notes[:100]}...")
+            log.debug("Worker: Notes preview: %s...", notes[:100])
         if not notes:
             return False
         # Only consider notes with **** markers as "meeting notes"
@@ -928,26 +1669,22 @@ class PowerPointWorker:
         v0.0.50: Strips **** markers and <meeting notes> tags from notes.
         v0.0.53: Only extracts text BETWEEN **** markers, ignoring text before/after.
         """
-        import re
         if not notes:
             return notes
 
         # v0.0.53: Extract only text between **** markers
         # Pattern: **** content **** (ignoring text before first and after last)
-        marker_pattern = r'\*{4,}\s*(.*?)\s*\*{4,}'
-        match = re.search(marker_pattern, notes, re.DOTALL)
+        match = _NOTES_MARKER_BLOCK_RE.search(notes)
         if match:
             cleaned = match.group(1)
         else:
             # Fallback: just remove markers (shouldn't happen if **** check passed)
-            cleaned = re.sub(r'\*{4,}\s*', '', notes)
+            cleaned = _NOTES_MARKER_RE.sub('', notes)
 
-        # Remove <meeting notes> and </meeting notes> tags (case insensitive)
-        cleaned = re.sub(r'</?meeting\s*notes>', '', cleaned, flags=re.IGNORECASE)
-        # Remove <critical notes> and </critical notes> tags (case insensitive)
-        cleaned = re.sub(r'</?critical\s*notes>', '', cleaned, flags=re.IGNORECASE)
+        # Remove <meeting notes> and <critical notes> tags (case insensitive)
+        cleaned = _NOTES_TAG_RE.sub('', cleaned)
         # Clean up extra whitespace
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+        cleaned = _WHITESPACE_RE.sub(' ', cleaned).strip()
         return cleaned
 
     def _announce_slide_notes(self):
@@ -963,40 +1700,57 @@ class PowerPointWorker:
         if notes and '****' in notes:
             cleaned = self._clean_notes_text(notes)
             self._announce(cleaned)
-            log.info(f"Worker: Announced meeting notes ({len(cleaned)} chars)")
+            log.info("Worker: Announced meeting notes (%s chars)", len(cleaned))
         else:
             self._announce("No notes")
             log.info("Worker: No notes on slide")
 
-    def _get_comments_on_current_slide(self):
-        """Get all comments on current slide."""
-        try:
-            window = self._get_window()
-            if not window:
-                log.debug("Worker: No window available for getting comments")
-                return []
+    def _count_comments_on_current_slide(self):
+        """Get the number of comments on the current slide.
 
-            slide = window.View.Slide
-            comments = []
-            comment_count = slide.Comments.Count
-            log.debug(f"Worker: Found {comment_count} comments on slide")
+        One Comments.Count read instead of fetching every comment, which is
+        all the slide-change announcement needs.
+        """
+        try:
+            slide = self._get_slide()
+            if not slide:
+                log.debug("Worker: No window available for counting comments")
+                return 0
+            comment_count = _get_com_path(slide, "Slide", "Comments", "Count")
+            log.debug("Worker: Found %d comments on slide", comment_count)
+            return comment_count
+        except Exception as e:
+            # The slide may have been deleted - fetch it afresh next time
+            self._current_slide = None
+            log.debug("Worker: Could not count comments - %s", e)
+            return 0
 
-            # COM collections are 1-indexed
-            for i in range(1, comment_count + 1):
-                try:
-                    comment = slide.Comments.Item(i)
-                    comments.append({
-                        'text': comment.Text,
-                        'author': comment.Author,
-                        'datetime': comment.DateTime
-                    })
-                except Exception as e:
-                    log.warning(f"Worker: Error reading comment {i} - {e}")
+    def _get_comments_details(self):
+        """Get text and author of every comment on the current slide.
 
-            return comments
+        Two COM calls per comment - only use where the fields are needed.
+        DateTime is not read since nothing announces it (event_gainFocus
+        strips dates from the comment cards).
+        """
+        comments = []
+        try:
+            slide = self._get_slide()
+            if not slide:
+                log.debug("Worker: No window available for getting comments")
+                return comments
+
+            # Resolve the collection once and enumerate it, rather than
+            # re-reading slide.Comments and calling Item(i) for every comment.
+            # A failure stops the walk but keeps the comments read so far.
+            for comment in slide.Comments:
+                comments.append({
+                    'text': comment.Text,
+                    'author': comment.Author,
+                })
+            log.debug("Worker: Found %d comments on slide", len(comments))
         except Exception as e:
-            log.debug(f"Worker: Could not get comments - {e}")
-            return []
+            log.debug("Worker: Could not get comments - %s", e)
+        return comments
 
     def _announce_slide_comments(self):
         """Announce slide info and comment status for current slide.
@@ -1012,7 +1766,7 @@ class PowerPointWorker:
         # Events can fire out of order or get stuck
         actually_in_slideshow = self._is_slideshow_running()
         if actually_in_slideshow != self._in_slideshow:
-            log.info(f"Worker: Fixing slideshow state mismatch - flag={self._in_slideshow}, actual={actually_in_slideshow}")
+            log.info("Worker: Fixing slideshow state mismatch - flag=%s, actual=%s", self._in_slideshow, actually_in_slideshow)
             self._in_slideshow = actually_in_slideshow
             if not actually_in_slideshow:
                 self._slideshow_window = None
@@ -1023,11 +1777,13 @@ class PowerPointWorker:
 
         # v0.0.70: Cache values for event_gainFocus to read
         # Get comments and notes status FIRST so we can use them in announcements
-        comments = self._get_comments_on_current_slide()
-        self._last_comment_count = len(comments) if comments else 0
-        self._last_has_notes = self._has_meeting_notes()
+        self._last_comment_count = self._count_comments_on_current_slide()
+        # The notes check is half a dozen COM calls and only feeds the
+        # Comments pane announcement below - CustomSlide._get_name reads
+        # notes itself for normal navigation
+        self._last_has_notes = self._from_comments_navigation and self._has_meeting_notes()
 
-        log.info(f"Worker: Cached - comments={self._last_comment_count}, has_notes={self._last_has_notes}")
+        log.info("Worker: Cached - comments=%s, has_notes=%s", self._last_comment_count, self._last_has_notes)
 
         # v0.0.75: Normal navigation handled by event_NVDAObject_init
         # which modifies obj.name BEFORE NVDA announces it.
@@ -1044,31 +1800,25 @@ class PowerPointWorker:
                 if self._last_has_notes:
                     prefix_parts.append("has notes")
                 if self._last_comment_count > 0:
-                    if self._last_comment_count == 1:
-                        prefix_parts.append("Has 1 comment")
-                    else:
-                        prefix_parts.append(f"Has {self._last_comment_count} comments")
-
-                # Announce prefix first (if any)
-                if prefix_parts:
-                    prefix = ", ".join(prefix_parts)
-                    self._announce(prefix)
-                    log.info(f"Worker: Announced prefix '{prefix}'")
+                    prefix_parts.append(_comment_count_text(self._last_comment_count))
 
-                # Then announce slide title
+                # Prefix (if any) then slide title, as one message so a
+                # coalesced announcement never drops half of it
                 if slide_title:
                     slide_msg = f"{slide_index}: {slide_title}"
                 else:
                     slide_msg = f"Slide {slide_index}"
-                self._announce(slide_msg)
-                log.info(f"Worker: Announced slide '{slide_msg}'")
+                if prefix_parts:
+                    slide_msg = f"{', '.join(prefix_parts)}, {slide_msg}"
+                self._announce(slide_msg, coalesce=True)
+                log.info("Worker: Announced slide '%s'", slide_msg)
 
         # Reset flag after use
         if self._from_comments_navigation:
             self._from_comments_navigation = False
 
         # Open comments pane if there are comments
-        if comments:
+        if self._last_comment_count:
             self._open_comments_pane()
 
     def _is_comments_pane_visible(self):
@@ -1077,24 +1827,53 @@ class PowerPointWorker:
         v0.0.25: Uses GetMso to check actual command state.
         GetMso returns msoButtonDown (True/-1) if pane is open.
 
+        The answer is reused for PANE_STATE_TTL_S, since the pane only opens
+        or closes when the user toggles it.
+
         Returns:
             True if Comments pane is visible, False otherwise
         """
+        checked_at, visible = self._pane_state
+        now = time.monotonic()
+        if now - checked_at < self.PANE_STATE_TTL_S:
+            return visible
+        visible = False
+        if self._comments_pane_mso is False:
+            # Every name failed last time - don't raise three COM errors again
+            return visible
         try:
+            command_bars = self._ppt_app.CommandBars
+            # Once a name has worked, skip the failing probes of the others
+            if self._comments_pane_mso:
+                try:
+                    state = command_bars.GetPressedMso(self._comments_pane_mso)
+                    log.debug("Worker: GetPressedMso('%s') = %s", self._comments_pane_mso, state)
+                    visible = bool(state)
+                    self._pane_state = (now, visible)
+                    return visible
+                except Exception as e:
+                    log.debug("Worker: GetPressedMso('%s') failed - %s", self._comments_pane_mso, e)
+                    self._comments_pane_mso = None
             # Check the state of the CommentsPane toggle button
             # GetMso returns the pressed state: True/-1 if pressed (pane open)
             for cmd in ["CommentsPane", "ReviewShowComments", "ShowComments"]:
                 try:
-                    state = self._ppt_app.CommandBars.GetPressedMso(cmd)
-                    log.info(f"Worker: GetPressedMso('{cmd}') = {state}")
-                    if state:  # True or -1 means pressed/active
-                        return True
+                    state = command_bars.GetPressedMso(cmd)
+                    log.info("Worker: GetPressedMso('%s') = %s", cmd, state)
+                    self._comments_pane_mso = cmd
+                    visible = bool(state)  # True or -1 means pressed/active
+                    break
                 except Exception as e:
-                    log.debug(f"Worker: GetPressedMso('{cmd}') failed - {e}")
+                    log.debug("Worker: GetPressedMso('%s') failed - %s", cmd, e)
                     continue
+            else:
+                # Remembered until the event connection is dropped
+                log.info("Worker: No Comments pane idMso answered GetPressedMso")
+                self._comments_pane_mso = False
         except Exception as e:
-            log.debug(f"Worker: Error checking pane visibility - {e}")
-        return False
+            log.debug("Worker: Error checking pane visibility - %s", e)
+        self._pane_state = (now, visible)
+        return visible
 
     def _open_comments_pane(self):
         """Open the Comments task pane if not already visible, then focus it.
@@ -1112,14 +1891,19 @@ class PowerPointWorker:
 
         # Pane is not visible - open it
         try:
-            # CommentsPane is the correct idMso (confirmed working in v0.0.25)
-            self._ppt_app.CommandBars.ExecuteMso("CommentsPane")
-            log.info("Worker: Opened Comments pane via CommentsPane")
+            # Toggle with the idMso the visibility check just found, so no
+            # failing ExecuteMso calls are made. CommentsPane is the correct
+            # idMso (confirmed working in v0.0.25) if none was found.
+            cmd = self._comments_pane_mso or "CommentsPane"
+            self._ppt_app.CommandBars.ExecuteMso(cmd)
+            # ExecuteMso toggled the pane - the cached state is now stale
+            self._pane_state = (0.0, False)
+            log.info("Worker: Opened Comments pane via %s", cmd)
             # Request focus to move to the pane
             self._request_focus_comments_pane()
             return True
         except Exception as e:
-            log.error(f"Worker: Error opening Comments pane - {e}")
+            log.error("Worker: Error opening Comments pane - %s", e)
         return False
 
     def _request_focus_comments_pane(self):
@@ -1138,40 +1922,65 @@ class PowerPointWorker:
         v0.0.23: Renamed to private method - must run on worker thread.
 
         Args:
-            direction: 1 for next slide, -1 for previous slide
+            direction: Slides to move - 1 for next, -1 for previous, or the
+                sum of several queued presses. A move past either end stops
+                at the first or last slide.
 
         Returns:
             True if navigation succeeded, False otherwise
         """
         try:
-            window = self._get_window()
-            if not window:
+            view = self._get_view()
+            if not view:
                 log.warning("Worker: No window for slide navigation")
                 self._announce("Cannot navigate - no active presentation")
                 return False
 
-            current_index = window.View.Slide.SlideIndex
-            presentation = window.Presentation
-            total_slides = presentation.Slides.Count
+            # Normally only GotoSlide goes to PowerPoint; position and count
+            # come from the slide-change events and earlier navigations
+            current_index = self._cached_slide_index
+            if current_index is None:
+                current_index = self._get_current_slide_index()
+            total_slides = self._cached_slide_count
+            if total_slides is None:
+                total_slides = self._get_slide_count()
 
             new_index = current_index + direction
+            if new_index < 1 or new_index > total_slides:
+                # Slides may have been added or removed since - confirm first
+                current_index = self._get_current_slide_index()
+                total_slides = self._get_slide_count()
+                new_index = current_index + direction
+                if current_index < 1:
+                    log.warning("Worker: Current slide unavailable for navigation")
+                    self._announce("Navigation failed")
+                    return False
 
             if new_index < 1:
-                log.info("Worker: Already at first slide")
-                self._announce("First slide")
-                return False
+                if current_index <= 1:
+                    log.info("Worker: Already at first slide")
+                    self._announce("First slide")
+                    return False
+                new_index = 1
             elif new_index > total_slides:
-                log.info("Worker: Already at last slide")
-                self._announce("Last slide")
-                return False
+                if current_index >= total_slides:
+                    log.info("Worker: Already at last slide")
+                    self._announce("Last slide")
+                    return False
+                new_index = total_slides
 
             # Navigate to the new slide
-            window.View.GotoSlide(new_index)
-            log.info(f"Worker: Navigated to slide {new_index}")
+            view.GotoSlide(new_index)
+            self._cached_slide_index = new_index
+            self._current_slide = None
+            log.info("Worker: Navigated to slide %s", new_index)
             return True
 
         except Exception as e:
-            log.error(f"Worker: Error navigating slide - {e}")
+            self._current_slide = None
+            self._cached_slide_index = None
+            self._cached_slide_count = None
+            log.error("Worker: Error navigating slide - %s", e)
             self._announce("Navigation failed")
             return False
 
@@ -1323,10 +2132,7 @@ class CustomSlideShowWindow(SlideShowWindow):
 
         comment_count = getattr(worker, '_slideshow_comment_count', 0)
         if comment_count > 0:
-            if comment_count == 1:
-                prefix_parts.append("Has 1 comment")
-            else:
-                prefix_parts.append(f"Has {comment_count} comments")
+            prefix_parts.append(_comment_count_text(comment_count))
 
         # Build the announcement
         # Use cached title if available, otherwise fall back to slide number
@@ -1397,11 +2203,7 @@ class CustomSlide(Slide):
             notes_page = self.ppObject.NotesPage
             # Placeholder 2 is the notes body text
             placeholder = notes_page.Shapes.Placeholders(2)
-            if placeholder.HasTextFrame:
-                text_frame = placeholder.TextFrame
-                if text_frame.HasText:
-                    notes_text = text_frame.TextRange.Text
-                    return '****' in notes_text
+            return '****' in _get_shape_text(placeholder)
         except Exception as e:
             log.debug(f"CustomSlide._has_meeting_notes: Error - {e}")
         return False
@@ -1439,10 +2241,7 @@ class CustomSlide(Slide):
         # Check comment count
         comment_count = self._get_comment_count()
         if comment_count > 0:
-            if comment_count == 1:
-                prefix_parts.append("Has 1 comment")
-            else:
-                prefix_parts.append(f"Has {comment_count} comments")
+            prefix_parts.append(_comment_count_text(comment_count))
             log.debug(f"CustomSlide._get_name: Slide {slide_number} has {comment_count} comments")
 
         if prefix_parts:
@@ -1473,17 +2272,31 @@ class AppModule(AppModule):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # Worker thread is started on first focus (see _start_worker)
         self._worker = None
+        # (weak reference to the focus object, result) of the last
+        # _is_in_comments_pane walk; reset on every focus change. Weak so the
+        # cache never keeps an old NVDAObject (and its UIA element) alive.
+        self._comments_pane_check = (None, False)
 
         # v0.0.76: Store reference for CustomSlide to access worker
         global _current_app_module
         _current_app_module = self
 
+        log.info(f"PowerPoint Comments AppModule instantiated (v{ADDON_VERSION})")
+
+    def _start_worker(self):
+        """Create and start the COM worker thread.
+
+        Deferred until PowerPoint first gains focus, so NVDA starting with
+        PowerPoint in the background does not spin up a thread and STA
+        apartment that may never be used.
+        """
         try:
             self._worker = PowerPointWorker()
             self._worker.start()
-            log.info(f"PowerPoint Comments AppModule instantiated (v{ADDON_VERSION})")
         except Exception as e:
+            self._worker = None
             log.error(f"PowerPoint Comments: Failed to create worker - {e}")
 
     def event_appModule_gainFocus(self):
@@ -1492,9 +2305,11 @@ class AppModule(AppModule):
         IMPORTANT: This is an optional hook - parent class doesn't define it.
         Do NOT call super() here - it will fail with AttributeError.
 
-        Requests initialization from the worker thread.
+        Starts the worker thread on first focus, then requests initialization.
         """
         log.info("PowerPoint Comments: App gained focus - requesting initialization")
+        if self._worker is None:
+            self._start_worker()
         if self._worker:
             self._worker.request_initialize()
         else:
@@ -1565,18 +2380,17 @@ class AppModule(AppModule):
         v0.0.46: Use _pending_auto_focus for reliable auto-tab after slide navigation.
         v0.0.68: Add slide object discovery diagnostics for normal mode announcement fix.
         """
+        self._comments_pane_check = (None, False)
         try:
-            import re
             import ui
             from inputCore import manager as inputManager
             from keyboardHandler import KeyboardInputGesture
 
-            uia_id = getattr(obj, 'UIAAutomationId', '') or ''
-            name = getattr(obj, 'name', '') or ''
-            description = getattr(obj, 'description', '') or ''
-            role = getattr(obj, 'role', None)
-            role_name = getattr(obj, 'roleText', '') or ''
-            states = getattr(obj, 'states', set()) or set()
+            try:
+                uia_id = obj.UIAAutomationId or ''
+            except (AttributeError, COMError):
+                uia_id = ''
+            name = obj.name or ''
 
             # v0.0.70: Phase 2 - Prepend notes/comments before slide title
             # Slide object signature (from Phase 1 discovery):
@@ -1592,19 +2406,17 @@ class AppModule(AppModule):
             )
 
             if is_slide_focus:
-                log.info(f"SLIDE_FOCUS: Detected slide focus - '{name[:50]}'")
+                log.info("SLIDE_FOCUS: Detected slide focus - '%s'", name[:50])
                 # v0.0.73: REMOVED prefix announcement from event_gainFocus
                 # The cached values are STALE at this point (from the PREVIOUS slide).
                 # The worker thread announces the prefix with correct timing since it
                 # queries the NEW slide's data before announcing.
                 # See _announce_slide_comments() for all prefix announcements.
 
-            # Normalize whitespace - PowerPoint uses non-breaking spaces (U+00A0)
-            name_normalized = re.sub(r'\s+', ' ', name)
-
             # v0.0.55: Detailed UIA logging for comment types (resolved, removed, status changes)
-            # Log all comment-related elements for research purposes
-            is_comment_element = (
+            # Log all comment-related elements for research purposes - only
+            # when info logging is on, since it fetches extra UIA properties
+            is_comment_element = log.isEnabledFor(logging.INFO) and (
                 uia_id.startswith('cardRoot_') or
                 uia_id.startswith('postRoot_') or
                 uia_id == 'NewCommentButton' or
@@ -1615,25 +2427,30 @@ class AppModule(AppModule):
                 'removed' in name.lower()
             )
             if is_comment_element:
-                log.info(f"=== UIA COMMENT ELEMENT ===")
-                log.info(f"  UIAAutomationId: {uia_id}")
-                log.info(f"  Name: {name[:200] if name else '(empty)'}")
-                log.info(f"  Name normalized: {name_normalized[:200] if name_normalized else '(empty)'}")
-                log.info(f"  Description: {description[:200] if description else '(empty)'}")
-                log.info(f"  Role: {role} ({role_name})")
-                log.info(f"  States: {states}")
+                description = obj.description or ''
+                name_normalized = _WHITESPACE_RE.sub(' ', name)
+                role = getattr(obj, 'role', None)
+                role_name = getattr(obj, 'roleText', '') or ''
+                states = getattr(obj, 'states', set()) or set()
+                log.info("=== UIA COMMENT ELEMENT ===")
+                log.info("  UIAAutomationId: %s", uia_id)
+                log.info("  Name: %s", name[:200] or '(empty)')
+                log.info("  Name normalized: %s", name_normalized[:200] or '(empty)')
+                log.info("  Description: %s", description[:200] or '(empty)')
+                log.info("  Role: %s (%s)", role, role_name)
+                log.info("  States: %s", states)
                 # Log additional UIA properties if available
                 try:
                     class_name = getattr(obj, 'UIAClassName', '') or ''
-                    log.info(f"  ClassName: {class_name}")
+                    log.info("  ClassName: %s", class_name)
                 except:
                     pass
                 try:
                     control_type = getattr(obj, 'UIAControlType', '') or ''
-                    log.info(f"  ControlType: {control_type}")
+                    log.info("  ControlType: %s", control_type)
                 except:
                     pass
-                log.info(f"=== END UIA COMMENT ELEMENT ===")
+                log.info("=== END UIA COMMENT ELEMENT ===")
 
             # Detect if we're in the Comments pane (NewCommentButton, cardRoot_, or postRoot_)
             is_in_comments = (
@@ -1661,7 +2478,7 @@ class AppModule(AppModule):
                     return  # Don't announce the button
                 # If we landed directly on a comment, just mark as in pane (no tab needed)
                 else:
-                    log.info(f"Auto-focus after slide change - already on comment: {uia_id[:30]}")
+                    log.info("Auto-focus after slide change - already on comment: %s", uia_id[:30])
 
             # v0.0.44: Auto-tab from NewCommentButton on initial F6 entry
             elif uia_id == 'NewCommentButton':
@@ -1674,29 +2491,24 @@ class AppModule(AppModule):
                     KeyboardInputGesture.fromName("tab").send()
                     return  # Don't announce the button
 
-            # Check if this is a comment thread card (cardRoot_)
-            is_comment_card = (
-                uia_id.startswith('cardRoot_') or
-                'Comment thread started by' in name_normalized
-            )
-
-            # Check if this is a reply comment (postRoot_)
-            is_reply_comment = (
-                uia_id.startswith('postRoot_') or
-                name_normalized.startswith('Comment by ')
-            )
+            # Thread cards (cardRoot_) and replies (postRoot_) are normally
+            # identified by UIAutomationId; every other focus change skips
+            # reading the description and parsing the name
+            is_comment_card = uia_id.startswith('cardRoot_')
+            is_reply_comment = uia_id.startswith('postRoot_')
+            if not uia_id and 'Comment' in name:
+                # v0.0.34: Name-based fallback when UIAutomationId is not available
+                is_comment_card = _is_thread_card_name(name)
+                is_reply_comment = (
+                    not is_comment_card and
+                    _WHITESPACE_RE.sub(' ', name).startswith('Comment by ')
+                )
+            if is_comment_card or is_reply_comment:
+                description = obj.description or ''
 
             if is_comment_card:
                 # Extract author and resolved state for thread cards
-                is_resolved = name_normalized.startswith("Resolved ")
-                author = ""
-
-                if " started by " in name_normalized:
-                    author_part = name_normalized.split(" started by ", 1)[1]
-                    if ", with " in author_part:
-                        author = author_part.split(", with ")[0]
-                    else:
-                        author = author_part
+                is_resolved, author = _parse_thread_name(name)
 
                 if author and description:
                     # v0.0.48: Skip cancelSpeech after slide navigation to let title finish
@@ -1710,28 +2522,15 @@ class AppModule(AppModule):
                     else:
                         formatted = f"{author}: {description}"
                     ui.message(formatted)
-                    log.info(f"Comment reformatted: {formatted[:80]}")
+                    log.info("Comment reformatted: %s", formatted[:80])
                     return
 
             elif is_reply_comment:
                 # v0.0.56: Handle multiple reply/status formats:
                 # - "Comment by Author on Month Day, Year, Time" -> "Author: description"
                 # - "Task updated by Author on Month Day, Year, Time" -> "Author - description"
-                author = ""
-                is_task_status = False
-
-                if name_normalized.startswith("Task updated by "):
-                    # Task status update: "Task updated by Author on ..."
-                    # Description will be "Completed a task" or "Reopened a task"
-                    after_prefix = name_normalized[16:]  # Skip "Task updated by "
-                    if " on " in after_prefix:
-                        author = after_prefix.split(" on ", 1)[0]
-                    is_task_status = True
-                elif name_normalized.startswith("Comment by "):
-                    # Regular reply: "Comment by Author on ..."
-                    after_prefix = name_normalized[11:]  # Skip "Comment by "
-                    if " on " in after_prefix:
-                        author = after_prefix.split(" on ", 1)[0]
+                # Task status descriptions are "Completed a task" or "Reopened a task"
+                is_task_status, author = _parse_reply_name(name)
 
                 if author and description:
                     # v0.0.48: Skip cancelSpeech after slide navigation to let title finish
@@ -1751,11 +2550,11 @@ class AppModule(AppModule):
                         formatted = f"{author}: {description}"
 
                     ui.message(formatted)
-                    log.info(f"Reply/Status reformatted: {formatted[:80]}")
+                    log.info("Reply/Status reformatted: %s", formatted[:80])
                     return
 
         except Exception as e:
-            log.error(f"event_gainFocus error: {e}")
+            log.error("event_gainFocus error: %s", e)
 
         nextHandler()
 
@@ -1774,30 +2573,87 @@ class AppModule(AppModule):
             if not focus:
                 return False
 
-            # Check focused element and walk up parent chain
-            obj = focus
-            for _ in range(15):
+            # Held-down PageUp/PageDown asks repeatedly for the same focus -
+            # reuse the answer until event_gainFocus reports a new object
+            cached_ref, cached_result = self._comments_pane_check
+            if cached_ref is not None and cached_ref() is focus:
+                return cached_result
+
+            result = False
+            # Most PageUp/PageDown presses land on a comment card itself, so
+            # settle the leaf before climbing: its id, or the thread-card name
+            # when the card exposes no id
+            # Only UIA objects have UIAAutomationId; name and parent are
+            # defined on every NVDAObject
+            try:
+                uia_id = focus.UIAAutomationId or ''
+            except (AttributeError, COMError):
+                uia_id = ''
+            if uia_id in _COMMENTS_UIA_EXACT or uia_id.startswith(_COMMENTS_UIA_PREFIXES):
+                log.debug("_is_in_comments_pane: MATCH - UIAutomationId='%s'", uia_id)
+                self._comments_pane_check = (weakref.ref(focus), True)
+                return True
+            if not uia_id and _is_thread_card_name(focus.name or ''):
+                log.debug("_is_in_comments_pane: MATCH - comment thread name")
+                self._comments_pane_check = (weakref.ref(focus), True)
+                return True
+
+            # Walk up the parent chain
+            # The pane's ids sit at most six levels above anything in it -
+            # a deeper focus, or reaching the top-level PowerPoint window, is
+            # outside the pane. Nested panes have the Window role too, so the
+            # walk stops only at the foreground object itself.
+            foreground = api.getForegroundObject()
+            obj = focus.parent
+            for _ in range(7):
                 if obj is None:
                     break
+                # Get UIAutomationId - this is the stable identifier
                 try:
-                    # Get UIAutomationId - this is the stable identifier
-                    uia_id = getattr(obj, 'UIAAutomationId', '') or ''
-
-                    # Check for any Comments pane identifier
-                    if (uia_id == 'NewCommentButton' or
-                        uia_id == 'CommentsList' or
-                        uia_id.startswith('cardRoot_') or
-                        uia_id.startswith('firstPaneElement')):
-                        log.debug(f"_is_in_comments_pane: MATCH - UIAutomationId='{uia_id}'")
-                        return True
-                except Exception:
-                    pass
-                obj = getattr(obj, 'parent', None)
+                    uia_id = obj.UIAAutomationId or ''
+                except (AttributeError, COMError):
+                    uia_id = ''
+
+                # Check for any Comments pane identifier
+                if uia_id in _COMMENTS_UIA_EXACT or uia_id.startswith(_COMMENTS_UIA_PREFIXES):
+                    log.debug("_is_in_comments_pane: MATCH - UIAutomationId='%s'", uia_id)
+                    result = True
+                    break
+                if obj == foreground:
+                    break
+                # NVDAObject always defines parent (None at the top)
+                obj = obj.parent
+
+            self._comments_pane_check = (weakref.ref(focus), result)
+            return result
 
         except Exception as e:
-            log.error(f"_is_in_comments_pane: Error - {e}")
+            log.error("_is_in_comments_pane: Error - %s", e)
         return False
 
+    def _navigate_from_comments(self, gesture, direction):
+        """Queue a slide change if focus is in the Comments pane, else pass the key on.
+
+        Shared by the PageUp/PageDown scripts. The worker check comes first so
+        a missing worker never pays for the pane check.
+
+        Args:
+            gesture: The PageUp/PageDown gesture
+            direction: 1 for next slide, -1 for previous slide
+        """
+        if self._worker and self._is_in_comments_pane():
+            log.info("Page key in Comments pane - requesting slide %+d", direction)
+            # v0.0.46: Set pending flag so auto-tab triggers when focus returns
+            self._pending_auto_focus = True
+            self._in_comments_pane = False
+            # Drop the previous slide's queued speech so a held key is followed
+            # by the slide it lands on, not a backlog of skipped ones
+            speech.cancelSpeech()
+            self._worker.request_navigate(direction, from_comments_pane=True)
+        else:
+            # Pass through to PowerPoint
+            gesture.send()
+
     @script(
         gesture="kb:pageDown",
         description="Navigate to next slide (in Comments pane)",
@@ -1811,15 +2667,7 @@ class AppModule(AppModule):
         v0.0.46: Set _pending_auto_focus to trigger auto-tab when focus returns.
         Otherwise, passes the key through to PowerPoint.
         """
-        if self._is_in_comments_pane() and self._worker:
-            log.info("PageDown in Comments pane - requesting next slide")
-            # v0.0.46: Set pending flag so auto-tab triggers when focus returns
-            self._pending_auto_focus = True
-            self._in_comments_pane = False
-            self._worker.request_navigate(1, from_comments_pane=True)
-        else:
-            # Pass through to PowerPoint
-            gesture.send()
+        self._navigate_from_comments(gesture, 1)
 
     @script(
         gesture="kb:pageUp",
@@ -1834,15 +2682,7 @@ class AppModule(AppModule):
         v0.0.46: Set _pending_auto_focus to trigger auto-tab when focus returns.
         Otherwise, passes the key through to PowerPoint.
         """
-        if self._is_in_comments_pane() and self._worker:
-            log.info("PageUp in Comments pane - requesting previous slide")
-            # v0.0.46: Set pending flag so auto-tab triggers when focus returns
-            self._pending_auto_focus = True
-            self._in_comments_pane = False
-            self._worker.request_navigate(-1, from_comments_pane=True)
-        else:
-            # Pass through to PowerPoint
-            gesture.send()
+        self._navigate_from_comments(gesture, -1)
 
     @script(
         gesture="kb:control+alt+n",